@@ -1,48 +1,231 @@
 import requests
+import asyncio
 import json
+import logging
 import os
+import re
+import threading
 from typing import Dict, List, Optional, Union
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON decoding
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # optional: SIMD parsing for large payloads
+    simdjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # optional: on-disk cache for repeated GETs
+    CachedSession = None
+
+try:
+    import httpx
+except ImportError:  # optional: async client with HTTP/2
+    httpx = None
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # optional: python-dotenv handles quoting/export syntax
+    load_dotenv = None
+
+# Diagnostics (e.g. the Content-Encoding of each response) are logged at DEBUG level
+logger = logging.getLogger(__name__)
 
 # Load environment variables from .env file
 def load_env():
     """Load environment variables from .env file if it exists"""
     env_file = '.env'
-    if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+    if load_dotenv is not None:
+        load_dotenv(env_file, override=True)
+        return
+    
+    # One read and a bytes partition per line; comments and lines without '=' are skipped
+    try:
+        with open(env_file, 'rb') as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return
+    for line in lines:
+        key, sep, value = line.partition(b'=')
+        key = key.strip()
+        if sep and key and not key.startswith(b'#'):
+            os.environ[key.decode()] = value.strip().decode()
 
 # Load .env on import
 load_env()
 
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_fast_json_loads = orjson.loads if orjson else json.loads
+
+# Integer literals of 20+ digits may exceed 64 bits (e.g. u128 Orca sqrtPrice/liquidity);
+# orjson turns those into floats, so such bodies are decoded by the stdlib to stay exact.
+# Only values after ':', ',' or '[' count, so digit runs in base58 addresses
+# (So111...112, 111...1) keep the orjson path
+_WIDE_INT = re.compile(rb'[:,\[]\s*-?\d{20,}(?![\d.eE])')
+
+def _json_loads(raw: bytes):
+    """Decode JSON with orjson when available, keeping wide integers exact"""
+    if orjson is not None and _WIDE_INT.search(raw):
+        return json.loads(raw)
+    return _fast_json_loads(raw)
+_json_dumps = orjson.dumps if orjson else json.dumps
+
+# Sent only with request bodies; GETs carry no Content-Type
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _json_body(data):
+    """Return (body, headers) for a JSON payload; no body or header when data is None"""
+    if data is None:
+        return None, None
+    return _json_dumps(data), _JSON_HEADERS
+
+# Without orjson, bodies at least this large (OHLCV, transaction lists) are parsed
+# with simdjson when installed; once fully materialized, orjson is as fast or faster
+SIMDJSON_MIN_BYTES = 50 * 1024
+# simdjson parsers hold one document at a time, so each thread gets its own
+_thread_local = threading.local()
+
+# Endpoint paths used by the client methods; their full URLs are built once per client
+KNOWN_ENDPOINTS = (
+    'solana/latest-block',
+    'solana/trending-tokens',
+    'solana/tokens',
+    'solana/token-details',
+    'solana/price-current',
+    'solana/price-multi',
+    'solana/price-hour',
+    'solana/ohlcv/token',
+    'solana/holder-token-balances',
+    'solana/wallet-balance-history',
+    'solana/trade-statistics',
+    'solana/token-transactions',
+    'solana/traders/leaderboard',
+    'solana/token-pool-search',
+    'solana/orca/pool',
+    'solana/orca/pools/fee-metrics',
+    'solana/pool-transactions',
+)
+
+# Cache lifetimes (seconds) for idempotent GETs when caching is enabled
+# (CambrianAPI(cache=True) or CAMBRIAN_CACHE=1, requires requests-cache)
+CACHE_EXPIRE_AFTER = 60
+CACHE_URLS_EXPIRE_AFTER = {
+    '*/solana/latest-block': 1,
+    '*/solana/token-details': 3600,
+}
+
+# One pooled adapter shared by every client session, so all clients reuse the
+# same keep-alive connections while keeping their own headers (API key)
+_ADAPTER = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False
+    )
+)
+
+def _new_session(cache: bool = False) -> requests.Session:
+    """Create a client session backed by the shared connection pool"""
+    if cache:
+        if CachedSession is None:
+            raise ImportError("Response caching requires requests-cache: pip install requests-cache")
+        # API key headers are excluded from cache keys and stored responses by default
+        session = CachedSession(
+            '.cambrian_cache',
+            backend='sqlite',
+            expire_after=CACHE_EXPIRE_AFTER,
+            urls_expire_after=CACHE_URLS_EXPIRE_AFTER,
+            allowable_methods=('GET',)
+        )
+    else:
+        session = requests.Session()
+    session.mount('https://', _ADAPTER)
+    session.mount('http://', _ADAPTER)
+    return session
+
+class CambrianAPIError(requests.exceptions.HTTPError):
+    """
+    Raised when the API answers with a 4xx/5xx status
+    
+    Subclasses requests' HTTPError, so existing handlers for requests.HTTPError
+    or RequestException still catch it. Holds the status code and the first 200
+    bytes of the body; the message is only formatted when the error is displayed.
+    """
+    
+    def __init__(self, status_code: int, body: bytes = b'', response=None):
+        super().__init__(status_code, body, response=response)
+        self.status_code = status_code
+        self.body = body
+    
+    def __str__(self):
+        return f"HTTP Error {self.status_code}: {self.body.decode('utf-8', 'replace')}"
+
+# Paths probed by test_endpoints() to confirm the base URL and API key work
+TEST_PATHS = (
+    'solana/latest-block',
+    'solana/tokens',
+    'solana/trending-tokens',
+)
+
+def _resolve_config(api_key: str = None, base_url: str = None):
+    """Return (api_key, base_url), falling back to environment variables"""
+    api_key = api_key or os.getenv('CAMBRIAN_API_KEY')
+    base_url = (base_url or os.getenv('CAMBRIAN_BASE_URL', 'https://opabinia.cambrian.network/api/v1')).rstrip('/')
+    
+    if not api_key:
+        raise ValueError(
+            "API key is required. Either:\n"
+            "1. Pass it as parameter: CambrianAPI('your_key')\n"
+            "2. Set CAMBRIAN_API_KEY environment variable\n" 
+            "3. Create .env file with CAMBRIAN_API_KEY=your_key"
+        )
+    return api_key, base_url
+
+def _report_probe(url: str, response) -> bool:
+    """Print the outcome of a test_endpoints() probe; True if the endpoint works"""
+    print(f"Testing {url}: {response.status_code}")
+    if response.status_code == 200:
+        print(f"✅ Working endpoint found: {url}")
+        return True
+    elif response.status_code == 401:
+        print(f"   401 Unauthorized - API key issue")
+    elif response.status_code == 429:
+        print(f"   429 Rate Limited")
+    else:
+        print(f"   Response: {response.text[:100]}...")
+    return False
+
 class CambrianAPI:
     """
     Python client for the Cambrian API - Solana token and DeFi analytics
     """
     
-    def __init__(self, api_key: str = None, base_url: str = None):
+    def __init__(self, api_key: str = None, base_url: str = None, cache: bool = None):
         # Use environment variables if not provided
-        self.api_key = api_key or os.getenv('CAMBRIAN_API_KEY')
-        self.base_url = (base_url or os.getenv('CAMBRIAN_BASE_URL', 'https://opabinia.cambrian.network/api/v1')).rstrip('/')
+        self.api_key, self.base_url = _resolve_config(api_key, base_url)
         
-        if not self.api_key:
-            raise ValueError(
-                "API key is required. Either:\n"
-                "1. Pass it as parameter: CambrianAPI('your_key')\n"
-                "2. Set CAMBRIAN_API_KEY environment variable\n" 
-                "3. Create .env file with CAMBRIAN_API_KEY=your_key"
-            )
-            
-        self.session = requests.Session()
+        if cache is None:
+            cache = os.getenv('CAMBRIAN_CACHE', '').lower() in ('1', 'true', 'yes')
+        self.session = _new_session(cache)
         self.session.headers.update({
             'X-API-KEY': self.api_key,
-            'Content-Type': 'application/json',
-            'User-Agent': 'CambrianAPI-Python-Client'
+            'User-Agent': 'CambrianAPI-Python-Client',
+            # urllib3 includes 'br' only when a brotli package is installed to decode it
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        self._urls = {endpoint: f"{self.base_url}/{endpoint}" for endpoint in KNOWN_ENDPOINTS}
     
     def parse_response(self, response: List[Dict]) -> List[Dict]:
         """
@@ -58,61 +241,74 @@ class CambrianAPI:
         columns = result.get('columns', [])
         data_rows = result.get('data', [])
         
-        parsed = []
-        for row in data_rows:
-            row_dict = {}
-            for i, col_info in enumerate(columns):
-                col_name = col_info['name']
-                if i < len(row):
-                    row_dict[col_name] = row[i]
-            parsed.append(row_dict)
+        # zip stops at the shorter side, so short rows simply omit trailing columns
+        col_names = [col_info['name'] for col_info in columns]
+        return [dict(zip(col_names, row)) for row in data_rows]
+    
+    def parse_response_soa(self, response: List[Dict]) -> Dict[str, List]:
+        """
+        Convert Cambrian API database-style response to columnar format
         
-        return parsed
+        Input: [{'columns': [...], 'data': [...], 'rows': N}]
+        Output: {'col1': [row1_val, row2_val, ...], 'col2': [...], ...}
+        """
+        if not response or len(response) == 0:
+            return {}
+            
+        result = response[0]
+        columns = result.get('columns', [])
+        data_rows = result.get('data', [])
+        
+        col_names = [col_info['name'] for col_info in columns]
+        width = len(col_names)
+        # Short rows are padded with None so every column keeps one entry per row
+        rows = [row if len(row) >= width else list(row) + [None] * (width - len(row)) for row in data_rows]
+        col_values = list(zip(*rows)) if rows else [()] * width
+        return {name: list(values) for name, values in zip(col_names, col_values)}
         
     def test_endpoints(self):
         """Test different endpoint variations to find correct API path"""
-        test_paths = [
-            'solana/latest-block',
-            'solana/tokens',
-            'solana/trending-tokens'
-        ]
-        
-        for path in test_paths:
-            try:
-                url = f"{self.base_url}/{path}"
-                response = self.session.get(url)
-                print(f"Testing {url}: {response.status_code}")
-                if response.status_code == 200:
-                    print(f"✅ Working endpoint found: {url}")
-                    return response.json()
-                elif response.status_code == 401:
-                    print(f"   401 Unauthorized - API key issue")
-                elif response.status_code == 429:
-                    print(f"   429 Rate Limited")
-                else:
-                    print(f"   Response: {response.text[:100]}...")
-            except Exception as e:
-                print(f"   Error: {e}")
+        # Probe all paths at once and report whichever answers first
+        executor = ThreadPoolExecutor(max_workers=len(TEST_PATHS))
+        try:
+            urls = [f"{self.base_url}/{path}" for path in TEST_PATHS]
+            futures = {executor.submit(self.session.get, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    response = future.result()
+                    if _report_probe(url, response):
+                        return self._parse_bytes(response.content)
+                except Exception as e:
+                    print(f"   Error: {e}")
+        finally:
+            # Don't wait on the slower probes; they finish in the background
+            executor.shutdown(wait=False)
         return None
     
     def _make_request(self, endpoint: str, method: str = 'GET', params: Dict = None, data: Dict = None) -> Dict:
         """Make HTTP request to API"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        path = endpoint if endpoint in self._urls else endpoint.lstrip('/')
+        url = self._urls.get(path) or f"{self.base_url}/{path}"
         
         try:
             if method.upper() == 'GET':
                 response = self.session.get(url, params=params)
             elif method.upper() == 'POST':
-                response = self.session.post(url, json=data, params=params)
+                body, headers = _json_body(data)
+                response = self.session.post(url, data=body, params=params, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
-            response.raise_for_status()
-            return response.json()
+            status_code = response.status_code
+            if status_code >= 400:
+                raise CambrianAPIError(status_code, response.content[:200], response=response)
+            
+            if getattr(response, 'from_cache', False):
+                print(f"♻️  Cached response: {path}")
+            logger.debug("Content-Encoding for %s: %s", path, response.headers.get('Content-Encoding', 'none'))
+            return self._parse_bytes(response.content)
             
-        except requests.exceptions.HTTPError as e:
-            print(f"HTTP Error {response.status_code}: {response.text}")
-            raise
         except requests.exceptions.RequestException as e:
             print(f"Request Error: {e}")
             raise
@@ -120,6 +316,26 @@ class CambrianAPI:
             print(f"Invalid JSON response: {response.text}")
             raise
     
+    def _parse_bytes(self, raw: bytes):
+        """Decode a JSON body, using simdjson for large payloads if orjson is unavailable"""
+        if orjson is None and simdjson is not None and len(raw) >= SIMDJSON_MIN_BYTES:
+            parser = getattr(_thread_local, 'parser', None)
+            if parser is None:
+                parser = _thread_local.parser = simdjson.Parser()
+            try:
+                doc = parser.parse(raw)
+                # The parser's next call invalidates this document, so materialize it now
+                if isinstance(doc, simdjson.Array):
+                    return doc.as_list()
+                if isinstance(doc, simdjson.Object):
+                    return doc.as_dict()
+                return doc
+            except (ValueError, RuntimeError):
+                # Invalid JSON, or e.g. BIGINT_ERROR on integers wider than 64 bits:
+                # the regular decoder produces the error (or succeeds)
+                pass
+        return _json_loads(raw)
+    
     # Basic connectivity test  
     def get_latest_block(self) -> Dict:
         """Get latest block information"""
@@ -247,6 +463,96 @@ class CambrianAPI:
         return self._make_request('solana/pool-transactions', params=params)
 
 
+class AsyncCambrianAPI(CambrianAPI):
+    """
+    Async variant of CambrianAPI built on httpx with HTTP/2
+    
+    Every endpoint method (and test_endpoints) returns an awaitable, so
+    independent calls can be multiplexed over one connection with asyncio.gather():
+    
+        async with AsyncCambrianAPI() as cambrian:
+            block, trending = await asyncio.gather(
+                cambrian.get_latest_block(),
+                cambrian.get_trending_tokens()
+            )
+    """
+    
+    def __init__(self, api_key: str = None, base_url: str = None):
+        if httpx is None:
+            raise ImportError(
+                "AsyncCambrianAPI requires httpx with HTTP/2 support: pip install 'httpx[http2]'"
+            )
+        self.api_key, self.base_url = _resolve_config(api_key, base_url)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                'X-API-KEY': self.api_key,
+                'User-Agent': 'CambrianAPI-Python-Client'
+            },
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=16)
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the underlying HTTP/2 connection pool"""
+        await self._client.aclose()
+    
+    async def test_endpoints(self):
+        """Test different endpoint variations to find correct API path"""
+        async def probe(path):
+            try:
+                return path, await self._client.get(path), None
+            except Exception as e:
+                return path, None, e
+        
+        # Probe all paths at once and report whichever answers first
+        tasks = [asyncio.ensure_future(probe(path)) for path in TEST_PATHS]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                path, response, error = await next_done
+                if error is not None:
+                    print(f"   Error: {error}")
+                elif _report_probe(f"{self.base_url}/{path}", response):
+                    return self._parse_bytes(response.content)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return None
+    
+    async def _make_request(self, endpoint: str, method: str = 'GET', params: Dict = None, data: Dict = None) -> Dict:
+        """Make HTTP request to API"""
+        url = endpoint.lstrip('/')
+        
+        try:
+            if method.upper() == 'GET':
+                response = await self._client.get(url, params=params)
+            elif method.upper() == 'POST':
+                body, headers = _json_body(data)
+                response = await self._client.post(url, content=body, params=params, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            status_code = response.status_code
+            if status_code >= 400:
+                raise CambrianAPIError(status_code, response.content[:200], response=response)
+            
+            logger.debug("Content-Encoding for %s: %s", url, response.headers.get('Content-Encoding', 'none'))
+            return self._parse_bytes(response.content)
+            
+        except httpx.RequestError as e:
+            print(f"Request Error: {e}")
+            raise
+        except json.JSONDecodeError:
+            print(f"Invalid JSON response: {response.text}")
+            raise
+
+
 def main():
     """Example usage of the Cambrian API client"""
     
@@ -8,8 +8,13 @@ This script demonstrates the key workflows mentioned in your documentation:
 3. Portfolio Tracking & Management
 """
 
-from cambrian_client import CambrianAPI
+from cambrian_client import CambrianAPI, AsyncCambrianAPI
+import asyncio
 import json
+import sys
+
+import numpy as np
+import pandas as pd
 
 def print_section(title):
     print(f"\n{'='*60}")
@@ -20,7 +25,95 @@ def print_subsection(title):
     print(f"\n📊 {title}")
     print("-" * 40)
 
+# Number abbreviation tiers: (threshold, divisor, format), checked in order.
+# The final tier has no threshold and formats the value unabbreviated.
+_UNABBREVIATED = (float('-inf'), 1, '{:,.0f}')
+VOLUME_TIERS = ((1e9, 1e9, '{:.1f}B'), (1e6, 1e6, '{:.1f}M'), (1e3, 1e3, '{:.1f}K'), _UNABBREVIATED)
+TOTAL_VOLUME_TIERS = ((1e9, 1e9, '{:.1f}B'), (1e6, 1e6, '{:.1f}M'), _UNABBREVIATED)
+LEADER_VOLUME_TIERS = ((1e9, 1e9, '{:.2f}B'), (1e6, 1e6, '{:.1f}M'), _UNABBREVIATED)
+RANKED_VOLUME_TIERS = ((1e9, 1e9, '{:.1f}B'), (float('-inf'), 1e6, '{:.1f}M'))
+TRADE_TIERS = ((1e6, 1e6, '{:.1f}M'), (1e3, 1e3, '{:.1f}K'), (float('-inf'), 1, '{:,}'))
+RANKED_TRADE_TIERS = ((1e6, 1e6, '{:.1f}M'), (float('-inf'), 1e3, '{:.1f}K'))
+
+def humanize(value, tiers=VOLUME_TIERS, prefix='$'):
+    """Abbreviate a number using the first matching tier, e.g. 3714048756 -> '$3.7B'"""
+    for threshold, divisor, fmt in tiers:
+        if value >= threshold:
+            return prefix + fmt.format(value / divisor if divisor != 1 else value)
+
+# Trade statistics fields used by the analytics, defaulting to 0 when absent
+TRADE_STAT_COLUMNS = ['totalTradeCount', 'buyCount', 'sellCount', 'volumeBuyUSD', 'volumeSellUSD', 'totalVolumeUSD']
+# Trending token fields used by the demo (in token_rows tuple order) and their defaults
+TRENDING_COLUMNS = ['symbol', 'tokenAddress', 'currentPriceUSD', 'priceChangePercentage', 'volume24hUSD']
+TRENDING_DEFAULTS = {'symbol': 'Unknown', 'tokenAddress': 'N/A', 'currentPriceUSD': 0, 'priceChangePercentage': 0, 'volume24hUSD': 0}
+
+def build_trading_analysis(tokens, stats_by_address):
+    """Compute buy/sell ratios and sentiment for every token with trade statistics
+    
+    ``tokens`` are (symbol, address, ...) rows; returns one DataFrame row per
+    token that has statistics, in the order of ``tokens``.
+    """
+    rows = [
+        dict(stats_by_address[address], symbol=symbol[:8], address=address)
+        for symbol, address, *_ in tokens if stats_by_address.get(address)
+    ]
+    df = pd.DataFrame(rows, columns=['symbol', 'address'] + TRADE_STAT_COLUMNS)
+    df[TRADE_STAT_COLUMNS] = df[TRADE_STAT_COLUMNS].fillna(0)
+    
+    # Zero totals are masked to NaN so their ratios come out as 0 instead of inf
+    trades = df['totalTradeCount'].where(df['totalTradeCount'] > 0)
+    volume = df['totalVolumeUSD'].where(df['totalVolumeUSD'] > 0)
+    
+    analysis = pd.DataFrame({
+        'symbol': df['symbol'],
+        'address': df['address'],
+        'total_trades': df['totalTradeCount'].astype('int64'),
+        'buy_trades': df['buyCount'].astype('int64'),
+        'sell_trades': df['sellCount'].astype('int64'),
+        'buy_ratio': (df['buyCount'] / trades * 100).fillna(0),
+        'sell_ratio': (df['sellCount'] / trades * 100).fillna(0),
+        'buy_volume_usd': df['volumeBuyUSD'],
+        'sell_volume_usd': df['volumeSellUSD'],
+        'buy_volume_ratio': (df['volumeBuyUSD'] / volume * 100).fillna(0),
+        'sell_volume_ratio': (df['volumeSellUSD'] / volume * 100).fillna(0),
+        'total_volume_usd': df['totalVolumeUSD']
+    })
+    analysis['sentiment'] = np.select(
+        [analysis['buy_volume_ratio'] > 55, analysis['buy_volume_ratio'] < 45],
+        ["🟢 BULLISH", "🔴 BEARISH"],
+        default="🟡 NEUTRAL"
+    )
+    return analysis
+
+async def _gather_overview(cambrian, sol_address):
+    async with AsyncCambrianAPI(cambrian.api_key, cambrian.base_url) as async_cambrian:
+        return await asyncio.gather(
+            async_cambrian.get_trending_tokens(order_by="volume_usd_24h", limit=10),
+            async_cambrian.get_latest_block(),
+            async_cambrian.get_current_price(sol_address),
+            async_cambrian.get_token_details(sol_address)
+        )
+
+def fetch_overview(cambrian, sol_address):
+    """Fetch trending tokens, latest block, SOL price and SOL details concurrently
+    
+    Falls back to sequential calls when httpx (with HTTP/2) is not installed.
+    """
+    try:
+        return asyncio.run(_gather_overview(cambrian, sol_address))
+    except ImportError:
+        return (
+            cambrian.get_trending_tokens(order_by="volume_usd_24h", limit=10),
+            cambrian.get_latest_block(),
+            cambrian.get_current_price(sol_address),
+            cambrian.get_token_details(sol_address)
+        )
+
 def main():
+    # Block-buffer stdout so the report's many print() calls don't each flush a line
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     # Initialize API client - reads from .env file
     cambrian = CambrianAPI()
     
@@ -28,35 +121,35 @@ def main():
     print("This demo showcases the key use cases for Solana DeFi analytics")
     
     try:
+        # The independent Workflow 1/2 lookups are issued together up front
+        sol_address = "So11111111111111111111111111111111111111112"
+        trending_raw, block_raw, price_raw, details_raw = fetch_overview(cambrian, sol_address)
+        
         # ==============================================
         # Workflow 1: Token Research & Analysis
         # ==============================================
         print_section("WORKFLOW 1: Token Research & Analysis")
         
         print_subsection("Step 1: Discover Trending Tokens")
-        trending_raw = cambrian.get_trending_tokens(order_by="volume_usd_24h", limit=10)
-        trending_tokens = cambrian.parse_response(trending_raw)
+        # Decoded once into columns: the DataFrame feeds the vectorized analysis and
+        # token_rows (symbol, address, price, change, volume) feeds the tables
+        trending_df = pd.DataFrame(cambrian.parse_response_soa(trending_raw)).reindex(
+            columns=TRENDING_COLUMNS
+        ).fillna(TRENDING_DEFAULTS)
+        token_rows = list(trending_df.astype(object).itertuples(index=False, name=None))
         
-        print(f"Found {len(trending_tokens)} trending tokens by 24h volume (showing top 10):")
-        for i, token in enumerate(trending_tokens, 1):
-            symbol = token.get('symbol', 'Unknown')
-            price = token.get('currentPriceUSD', 0)
-            change = token.get('priceChangePercentage', 0)
-            volume = token.get('volume24hUSD', 0)
-            
+        print(f"Found {len(token_rows)} trending tokens by 24h volume (showing top 10):")
+        for i, (symbol, _, price, change, volume) in enumerate(token_rows, 1):
             change_emoji = "📈" if change >= 0 else "📉"
             print(f"  {i:2}. {symbol:8} | ${price:8.4f} | {change:+6.2f}% {change_emoji} | Vol: ${volume:,.0f}")
         
         print_subsection("Step 2: Deep Dive Analysis on SOL")
-        sol_address = "So11111111111111111111111111111111111111112"
         
         # Get current price
-        price_raw = cambrian.get_current_price(sol_address)
         price_data = cambrian.parse_response(price_raw)[0]
         print(f"SOL Current Price: ${price_data['priceUSD']:.4f}")
         
         # Get token details
-        details_raw = cambrian.get_token_details(sol_address)
         details = cambrian.parse_response(details_raw)
         if details:
             detail = details[0]
@@ -72,21 +165,16 @@ def main():
         print_section("WORKFLOW 2: Market Intelligence Dashboard")
         
         print_subsection("Latest Block Info")
-        block_raw = cambrian.get_latest_block()
         block_data = cambrian.parse_response(block_raw)[0]
         print(f"Block Number: {block_data['blockNumber']:,}")
         print(f"Block Time: {block_data['blockTime']} (Unix timestamp)")
         
         print_subsection("Top Volume Tokens Today")
-        for i, token in enumerate(trending_tokens[:3], 1):
-            symbol = token.get('symbol', 'Unknown')
-            volume = token.get('volume24hUSD', 0)
-            price = token.get('currentPriceUSD', 0)
-            
+        for i, (symbol, address, price, _, volume) in enumerate(token_rows[:3], 1):
             print(f"  #{i} {symbol}")
             print(f"     Price: ${price:.6f}")
             print(f"     24h Volume: ${volume:,.2f}")
-            print(f"     Address: {token.get('tokenAddress', 'N/A')}")
+            print(f"     Address: {address}")
             
         # ==============================================
         # Workflow 3: Price Analysis & Comparison
@@ -102,11 +190,8 @@ def main():
         print(f"{'Token':<12} {'Current Price':<15} {'24h Volume':<15} {'24h Change':<15} {'Trend'}")
         print("-" * 80)
         
-        for token in trending_tokens[:5]:
-            symbol = token.get('symbol', 'Unknown')[:10]
-            price = token.get('currentPriceUSD', 0)
-            volume = token.get('volume24hUSD', 0)
-            change_pct = token.get('priceChangePercentage', 0)
+        for symbol, _, price, change_pct, volume in token_rows[:5]:
+            symbol = symbol[:10]
             
             # Format price
             if price >= 1000:
@@ -117,14 +202,7 @@ def main():
                 price_str = f"${price:.6f}"
             
             # Format volume
-            if volume > 1000000000:
-                vol_str = f"${volume/1000000000:.1f}B"
-            elif volume > 1000000:
-                vol_str = f"${volume/1000000:.1f}M"
-            elif volume > 1000:
-                vol_str = f"${volume/1000:.1f}K"
-            else:
-                vol_str = f"${volume:,.0f}"
+            vol_str = humanize(volume)
             
             # Format change
             if change_pct >= 0:
@@ -142,41 +220,29 @@ def main():
         
         # Price performance analysis
         print_subsection("Price Performance Analysis")
-        gainers = [t for t in trending_tokens[:5] if t.get('priceChangePercentage', 0) > 0]
-        losers = [t for t in trending_tokens[:5] if t.get('priceChangePercentage', 0) < 0]
+        top5_df = trending_df.head(5)
+        gainers = top5_df[top5_df['priceChangePercentage'] > 0]
+        losers = top5_df[top5_df['priceChangePercentage'] < 0]
         
-        if gainers:
+        if not gainers.empty:
             print(f"📈 Top Gainers ({len(gainers)} tokens):")
-            for token in gainers[:3]:
-                symbol = token['symbol'][:8]
-                change = token.get('priceChangePercentage', 0)
-                price = token.get('currentPriceUSD', 0)
-                print(f"  • {symbol:8} +{change:.2f}% (${price:.6f})")
+            for token in gainers.head(3).itertuples():
+                symbol = token.symbol[:8]
+                print(f"  • {symbol:8} +{token.priceChangePercentage:.2f}% (${token.currentPriceUSD:.6f})")
         else:
             print("📈 No tokens with positive price movement in top 5")
         
-        if losers:
+        if not losers.empty:
             print(f"\n📉 Top Decliners ({len(losers)} tokens):")
-            for token in losers[:3]:
-                symbol = token['symbol'][:8]
-                change = token.get('priceChangePercentage', 0)
-                price = token.get('currentPriceUSD', 0)
-                print(f"  • {symbol:8} {change:.2f}% (${price:.6f})")
+            for token in losers.head(3).itertuples():
+                symbol = token.symbol[:8]
+                print(f"  • {symbol:8} {token.priceChangePercentage:.2f}% (${token.currentPriceUSD:.6f})")
         
         # Volume leaders
         print(f"\n💰 Volume Leaders:")
-        volume_sorted = sorted(trending_tokens[:5], 
-                             key=lambda x: x.get('volume24hUSD', 0), 
-                             reverse=True)
-        for i, token in enumerate(volume_sorted[:3], 1):
-            symbol = token['symbol'][:8]
-            volume = token.get('volume24hUSD', 0)
-            if volume > 1000000000:
-                vol_str = f"${volume/1000000000:.2f}B"
-            elif volume > 1000000:
-                vol_str = f"${volume/1000000:.1f}M"
-            else:
-                vol_str = f"${volume:,.0f}"
+        for i, token in enumerate(top5_df.nlargest(3, 'volume24hUSD').itertuples(), 1):
+            symbol = token.symbol[:8]
+            vol_str = humanize(token.volume24hUSD, LEADER_VOLUME_TIERS)
             print(f"  {i}. {symbol:8} {vol_str} (24h volume)")
                 
         
@@ -188,69 +254,33 @@ def main():
         print_subsection("Trade Statistics Analysis (Top 5 Trending Tokens)")
         print("🔍 Analyzing trading patterns, buy/sell ratios, and market sentiment...")
         
-        # Get trade statistics for each trending token
-        trading_analysis = []
-        for i, token in enumerate(trending_tokens[:5], 1):
-            token_address = token['tokenAddress']
-            symbol = token['symbol'][:8]
+        # Get trade statistics for all trending tokens in a single request -
+        # the endpoint accepts a comma-separated list of addresses
+        top_tokens = token_rows[:5]
+        stats_by_address = {}
+        try:
+            trade_stats_raw = cambrian.get_trade_statistics(
+                [address for _, address, *_ in top_tokens], timeframe="24h"
+            )
+            for stats in cambrian.parse_response(trade_stats_raw):
+                stats_by_address[stats.get('tokenAddress')] = stats
+        except Exception as e:
+            print(f"   ❌ Error getting trade stats - {e}")
+        
+        trading_df = build_trading_analysis(top_tokens, stats_by_address)
+        trading_analysis = trading_df.to_dict('records')
+        analysis_by_address = {analysis['address']: analysis for analysis in trading_analysis}
+        
+        for i, (symbol, address, *_) in enumerate(top_tokens, 1):
+            symbol = symbol[:8]
             
             print(f"\n📊 [{i}/5] Analyzing {symbol} trading patterns...")
             
-            try:
-                # Get trade statistics
-                trade_stats_raw = cambrian.get_trade_statistics([token_address], timeframe="24h")
-                trade_stats = cambrian.parse_response(trade_stats_raw)
-                
-                if trade_stats:
-                    stats = trade_stats[0]
-                    
-                    # Use the correct field names from API
-                    total_trades = stats.get('totalTradeCount', 0)
-                    buy_trades = stats.get('buyCount', 0)
-                    sell_trades = stats.get('sellCount', 0)
-                    buy_volume_usd = stats.get('volumeBuyUSD', 0)
-                    sell_volume_usd = stats.get('volumeSellUSD', 0)
-                    total_volume_usd = stats.get('totalVolumeUSD', 0)
-                    buy_to_sell_ratio = stats.get('buyToSellRatio', 0)
-                    
-                    # Calculate ratios
-                    buy_ratio = (buy_trades / total_trades * 100) if total_trades > 0 else 0
-                    sell_ratio = (sell_trades / total_trades * 100) if total_trades > 0 else 0
-                    buy_volume_ratio = (buy_volume_usd / total_volume_usd * 100) if total_volume_usd > 0 else 0
-                    sell_volume_ratio = (sell_volume_usd / total_volume_usd * 100) if total_volume_usd > 0 else 0
-                    
-                    # Determine market sentiment
-                    if buy_volume_ratio > 55:
-                        sentiment = "🟢 BULLISH"
-                    elif buy_volume_ratio < 45:
-                        sentiment = "🔴 BEARISH"
-                    else:
-                        sentiment = "🟡 NEUTRAL"
-                    
-                    trading_analysis.append({
-                        'symbol': symbol,
-                        'address': token_address,
-                        'total_trades': total_trades,
-                        'buy_trades': buy_trades,
-                        'sell_trades': sell_trades,
-                        'buy_ratio': buy_ratio,
-                        'sell_ratio': sell_ratio,
-                        'buy_volume_usd': buy_volume_usd,
-                        'sell_volume_usd': sell_volume_usd,
-                        'buy_volume_ratio': buy_volume_ratio,
-                        'sell_volume_ratio': sell_volume_ratio,
-                        'sentiment': sentiment,
-                        'total_volume_usd': total_volume_usd
-                    })
-                    
-                    print(f"   ✅ {symbol}: {total_trades:,} trades, {sentiment}")
-                
-                else:
-                    print(f"   ⚠️  {symbol}: No trade statistics available")
-                    
-            except Exception as e:
-                print(f"   ❌ {symbol}: Error getting trade stats - {e}")
-                continue
+            analysis = analysis_by_address.get(address)
+            if analysis:
+                print(f"   ✅ {symbol}: {analysis['total_trades']:,} trades, {analysis['sentiment']}")
+            else:
+                print(f"   ⚠️  {symbol}: No trade statistics available")
         
         if trading_analysis:
             print(f"\n📋 Trading Analysis Summary (24h Period)")
@@ -269,19 +299,8 @@ def main():
                 total_volume = analysis['total_volume_usd']
                 
                 # Format numbers
-                if total_trades >= 1000000:
-                    trades_str = f"{total_trades/1000000:.1f}M"
-                elif total_trades >= 1000:
-                    trades_str = f"{total_trades/1000:.1f}K"
-                else:
-                    trades_str = f"{total_trades:,}"
-                
-                if total_volume > 1000000000:
-                    volume_str = f"${total_volume/1000000000:.1f}B"
-                elif total_volume > 1000000:
-                    volume_str = f"${total_volume/1000000:.1f}M"
-                else:
-                    volume_str = f"${total_volume:,.0f}"
+                trades_str = humanize(total_trades, TRADE_TIERS, prefix='')
+                volume_str = humanize(total_volume, TOTAL_VOLUME_TIERS)
                 
                 ratio_str = f"{buy_ratio:.1f}%/{sell_ratio:.1f}%"
                 vol_ratio_str = f"{buy_vol_ratio:.1f}%/{sell_vol_ratio:.1f}%"
@@ -292,9 +311,10 @@ def main():
             
             # Market sentiment analysis
             print_subsection("Market Sentiment Analysis")
-            bullish_tokens = [t for t in trading_analysis if "BULLISH" in t['sentiment']]
-            bearish_tokens = [t for t in trading_analysis if "BEARISH" in t['sentiment']]
-            neutral_tokens = [t for t in trading_analysis if "NEUTRAL" in t['sentiment']]
+            sentiment = trading_df['sentiment']
+            bullish_tokens = trading_df[sentiment.str.contains("BULLISH")].to_dict('records')
+            bearish_tokens = trading_df[sentiment.str.contains("BEARISH")].to_dict('records')
+            neutral_tokens = trading_df[sentiment.str.contains("NEUTRAL")].to_dict('records')
             
             print(f"🟢 Bullish Sentiment: {len(bullish_tokens)} tokens")
             for token in bullish_tokens:
@@ -312,25 +332,23 @@ def main():
             print_subsection("Trading Activity Rankings")
             
             # Most active by trade count
-            by_trades = sorted(trading_analysis, key=lambda x: x['total_trades'], reverse=True)
+            by_trades = trading_df.nlargest(3, 'total_trades').to_dict('records')
             print("🔥 Most Active by Trade Count:")
-            for i, token in enumerate(by_trades[:3], 1):
-                trades = token['total_trades']
-                trades_str = f"{trades/1000000:.1f}M" if trades >= 1000000 else f"{trades/1000:.1f}K"
+            for i, token in enumerate(by_trades, 1):
+                trades_str = humanize(token['total_trades'], RANKED_TRADE_TIERS, prefix='')
                 print(f"   {i}. {token['symbol']}: {trades_str} trades")
             
             # Highest volume
-            by_volume = sorted(trading_analysis, key=lambda x: x['total_volume_usd'], reverse=True)
+            by_volume = trading_df.nlargest(3, 'total_volume_usd').to_dict('records')
             print(f"\n💰 Highest Trading Volume:")
-            for i, token in enumerate(by_volume[:3], 1):
-                volume = token['total_volume_usd']
-                volume_str = f"${volume/1000000000:.1f}B" if volume >= 1000000000 else f"${volume/1000000:.1f}M"
+            for i, token in enumerate(by_volume, 1):
+                volume_str = humanize(token['total_volume_usd'], RANKED_VOLUME_TIERS)
                 print(f"   {i}. {token['symbol']}: {volume_str}")
             
             # Most bullish (highest buy ratio)
-            by_bullish = sorted(trading_analysis, key=lambda x: x['buy_volume_ratio'], reverse=True)
+            by_bullish = trading_df.nlargest(3, 'buy_volume_ratio').to_dict('records')
             print(f"\n📈 Most Bullish (Buy Volume %):")
-            for i, token in enumerate(by_bullish[:3], 1):
+            for i, token in enumerate(by_bullish, 1):
                 buy_ratio = token['buy_volume_ratio']
                 print(f"   {i}. {token['symbol']}: {buy_ratio:.1f}% buy volume")
                 
@@ -368,8 +386,11 @@ def main():
         
     except Exception as e:
         print(f"❌ Error during demo: {e}")
+        sys.stdout.flush()  # keep the traceback (stderr) after the buffered output
         import traceback
         traceback.print_exc()
+    finally:
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file